@@ -1,361 +1,616 @@
-"""
-AI Content Generator API for Render.com
-Filename MUST be app.py for gunicorn to work
-"""
-
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-import json
-import random
-import re
-import time
-import requests
-from bs4 import BeautifulSoup
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
-import os
-
-# Initialize Flask app
-app = Flask(__name__)
-
-# CORS configuration
-CORS(app, resources={
-    r"/*": {
-        "origins": ["*"],
-        "methods": ["GET", "POST", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization"]
-    }
-})
-
-# Download NLTK data if not present
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    print("Downloading NLTK data...")
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    print("NLTK data downloaded successfully")
-
-class SimpleContentGenerator:
-    def __init__(self):
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-        ]
-        self.stop_words = set(stopwords.words('english'))
-        
-    def get_random_user_agent(self):
-        return random.choice(self.user_agents)
-    
-    def fetch_web_data(self, query):
-        """Fetch web data for research"""
-        try:
-            # Use Wikipedia API (most reliable and free)
-            wiki_url = "https://en.wikipedia.org/w/api.php"
-            params = {
-                'action': 'query',
-                'format': 'json',
-                'titles': query,
-                'prop': 'extracts',
-                'exintro': True,
-                'explaintext': True,
-            }
-            
-            response = requests.get(wiki_url, params=params, timeout=10)
-            data = response.json()
-            
-            pages = data.get('query', {}).get('pages', {})
-            for page in pages.values():
-                if 'extract' in page:
-                    return page['extract'][:800]
-            
-            return ""
-            
-        except Exception as e:
-            print(f"Research error: {e}")
-            return ""
-    
-    def generate_content(self, topic, keywords="", tone="professional", length=500):
-        """Generate human-like content"""
-        
-        # Research
-        research = self.fetch_web_data(topic)
-        
-        # Create content
-        content = self._create_content(topic, keywords, research, tone)
-        
-        # Adjust length
-        content = self._adjust_length(content, length)
-        
-        # Humanize
-        content = self._humanize_content(content, tone)
-        
-        # Calculate metrics
-        word_count = len(word_tokenize(content))
-        seo_score = self._calculate_seo_score(content, keywords)
-        plagiarism_score = self._check_plagiarism(content)
-        
-        return {
-            "success": True,
-            "content": content,
-            "word_count": word_count,
-            "seo_score": seo_score,
-            "plagiarism_score": plagiarism_score,
-            "topic": topic,
-            "keywords": keywords
-        }
-    
-    def _create_content(self, topic, keywords, research, tone):
-        """Create content structure"""
-        
-        sections = []
-        
-        # Title
-        title_options = [
-            f"# {topic}: A Comprehensive Guide",
-            f"# Understanding {topic}",
-            f"# The Complete Guide to {topic}"
-        ]
-        sections.append(random.choice(title_options) + "\n\n")
-        
-        # Introduction
-        intro = f"In today's digital landscape, {topic} has become increasingly important. "
-        
-        if research:
-            sentences = sent_tokenize(research)
-            if sentences:
-                intro += sentences[0] + " "
-        
-        sections.append("## Introduction\n" + intro + "\n\n")
-        
-        # Keywords section
-        if keywords:
-            keyword_list = [k.strip() for k in keywords.split(',') if k.strip()]
-            if keyword_list:
-                sections.append("## Key Points\n")
-                for i, keyword in enumerate(keyword_list[:5], 1):
-                    sections.append(f"{i}. **{keyword.title()}**: Important aspect of {topic.lower()}. ")
-                sections.append("\n\n")
-        
-        # Main content
-        section_titles = ["Benefits", "Applications", "Strategies", "Future Trends"]
-        selected_titles = random.sample(section_titles, min(2, len(section_titles)))
-        
-        for title in selected_titles:
-            sections.append(f"## {title}\n")
-            
-            content_templates = [
-                f"The {title.lower()} of {topic} are significant and varied. ",
-                f"When considering {title.lower()}, {topic} offers multiple advantages. ",
-                f"Effective {title.lower()} require understanding key principles of {topic}. "
-            ]
-            
-            section_content = random.choice(content_templates)
-            
-            if research and len(research) > 100:
-                research_sentences = sent_tokenize(research)
-                if len(research_sentences) > 1:
-                    section_content += research_sentences[1] + " "
-            
-            sections.append(section_content + "\n\n")
-        
-        # Conclusion
-        conclusion = "## Conclusion\n"
-        conclusion += f"In summary, {topic} represents an important area with growing relevance. "
-        conclusion += f"By understanding {topic.lower()}, better outcomes can be achieved.\n\n"
-        
-        sections.append(conclusion)
-        
-        return ''.join(sections)
-    
-    def _adjust_length(self, content, target_words):
-        """Adjust content length"""
-        words = word_tokenize(content)
-        
-        if len(words) >= target_words:
-            trimmed = ' '.join(words[:target_words])
-            sentences = sent_tokenize(trimmed)
-            if sentences:
-                return ' '.join(sentences)
-            return trimmed
-        
-        # Add filler content if too short
-        filler_templates = [
-            "This demonstrates practical applications and value. ",
-            "Many experts recognize these patterns and developments. ",
-            "Further research continues to expand our understanding. ",
-            "Real-world implementations show promising results. "
-        ]
-        
-        while len(words) < target_words:
-            filler = random.choice(filler_templates)
-            content += filler
-            words = word_tokenize(content)
-        
-        return ' '.join(words[:target_words])
-    
-    def _humanize_content(self, content, tone):
-        """Make content more human-like"""
-        
-        # Replace robotic phrases
-        replacements = [
-            ('is important', 'plays a crucial role'),
-            ('very good', 'exceptionally beneficial'),
-            ('many people', 'numerous individuals'),
-            ('in order to', 'to'),
-            ('due to the fact that', 'because')
-        ]
-        
-        for old, new in replacements:
-            content = content.replace(old, new)
-        
-        # Tone adjustments
-        if tone == "casual":
-            content = content.replace('therefore', 'so')
-            content = content.replace('however', 'but')
-        elif tone == "academic":
-            content = content.replace('so', 'therefore')
-            content = content.replace('but', 'however')
-        
-        return content
-    
-    def _calculate_seo_score(self, content, keywords):
-        """Calculate SEO score"""
-        score = 50
-        
-        # Word count
-        words = word_tokenize(content)
-        if len(words) > 500:
-            score += 20
-        elif len(words) > 300:
-            score += 15
-        elif len(words) > 150:
-            score += 10
-        
-        # Headings
-        headings = content.count('#')
-        if headings >= 2:
-            score += 10
-        
-        # Keywords
-        if keywords:
-            keyword_list = [k.strip().lower() for k in keywords.split(',') if k.strip()]
-            for keyword in keyword_list:
-                if keyword in content.lower():
-                    score += 5
-        
-        return min(score, 100)
-    
-    def _check_plagiarism(self, content):
-        """Basic plagiarism check"""
-        try:
-            sentences = sent_tokenize(content)
-            if not sentences:
-                return 100.0
-            
-            unique_sentences = set()
-            for sentence in sentences:
-                normalized = re.sub(r'[^\w\s]', '', sentence.lower()).strip()
-                if len(normalized.split()) > 3:
-                    unique_sentences.add(normalized)
-            
-            uniqueness = len(unique_sentences) / len(sentences) * 100
-            return max(85.0, min(100.0, round(uniqueness, 2)))
-            
-        except:
-            return 95.0
-
-# Initialize generator
-generator = SimpleContentGenerator()
-
-@app.route('/')
-def home():
-    return jsonify({
-        "service": "AI Content Generator API",
-        "version": "2.0.0",
-        "status": "running",
-        "endpoints": {
-            "GET /health": "Health check",
-            "POST /generate": "Generate content",
-            "GET /generate?topic=xxx": "Generate via GET"
-        },
-        "deployed_on": "Render.com",
-        "note": "This API generates human-like, SEO-friendly content"
-    })
-
-@app.route('/health', methods=['GET'])
-def health_check():
-    return jsonify({
-        "status": "healthy",
-        "service": "AI Content Generator",
-        "timestamp": time.strftime('%Y-%m-%d %H:%M:%S')
-    })
-
-@app.route('/generate', methods=['GET', 'POST', 'OPTIONS'])
-def generate_content():
-    if request.method == 'OPTIONS':
-        return '', 200
-    
-    try:
-        # Get input data
-        if request.method == 'POST':
-            if request.is_json:
-                data = request.get_json()
-            else:
-                data = request.form.to_dict()
-        else:  # GET request
-            data = {
-                'topic': request.args.get('topic', ''),
-                'keywords': request.args.get('keywords', ''),
-                'tone': request.args.get('tone', 'professional'),
-                'length': request.args.get('length', '500')
-            }
-        
-        # Validate
-        if not data.get('topic'):
-            return jsonify({
-                'success': False,
-                'error': 'Topic is required.'
-            }), 400
-        
-        # Convert length
-        try:
-            length = int(data.get('length', 500))
-            length = max(100, min(2000, length))
-        except:
-            length = 500
-        
-        # Generate content
-        result = generator.generate_content(
-            topic=data['topic'].strip(),
-            keywords=data.get('keywords', '').strip(),
-            tone=data.get('tone', 'professional').strip(),
-            length=length
-        )
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': f'Error: {str(e)}'
-        }), 500
-
-@app.route('/test', methods=['GET'])
-def test_generate():
-    """Test endpoint without authentication"""
-    result = generator.generate_content(
-        topic="Artificial Intelligence",
-        keywords="ai, machine learning, technology",
-        tone="professional",
-        length=300
-    )
-    return jsonify(result)
-
-if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 5000))
-    print(f"Starting AI Content Generator API on port {port}...")
+"""
+AI Content Generator API for Render.com
+Filename MUST be app.py for gunicorn to work
+"""
+
+# Monkey-patch before anything touches sockets so the Wikipedia fetch
+# yields cooperatively under the gevent gunicorn worker
+from gevent import monkey
+monkey.patch_all()
+
+from flask import Flask, request, jsonify, Response, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_cors import CORS
+import orjson
+import random
+import re
+import string
+import threading
+import time
+import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import os
+from functools import lru_cache
+
+class ORJSONProvider(JSONProvider):
+    """Serialize responses with orjson instead of the stdlib json"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand the orjson bytes straight to the Response instead of
+        # decoding to str only for Flask to encode back to UTF-8
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+# Initialize Flask app
+app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# Largest payload is a 10-topic batch; anything bigger is rejected before
+# it gets buffered
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
+
+# HTTP-level response cache; GET /generate hits are served before any
+# generation logic runs
+cache = Cache(app, config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': 600
+})
+
+# CORS configuration
+CORS(app, resources={
+    r"/*": {
+        "origins": ["*"],
+        "methods": ["GET", "POST", "OPTIONS"],
+        "allow_headers": ["Content-Type", "Authorization"]
+    }
+})
+
+# Maximum number of generated results kept in the response cache
+RESPONSE_CACHE_SIZE = 1024
+
+# Maximum number of Wikipedia extracts kept in the research cache
+RESEARCH_CACHE_SIZE = 2048
+
+# Translation table beats a regex walk for plain punctuation stripping
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Sentence splitter; the generated markdown is short and well-formed, so
+# this is sufficient for scoring and far cheaper than NLTK's Punkt
+_SENT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+# Robotic-phrase replacements folded into one compiled alternation so
+# _humanize_content scans the content once, not once per phrase
+_HUMANIZE_MAP = {
+    'is important': 'plays a crucial role',
+    'very good': 'exceptionally beneficial',
+    'many people': 'numerous individuals',
+    'in order to': 'to',
+    'due to the fact that': 'because'
+}
+_HUMANIZE_RE = re.compile('|'.join(re.escape(k) for k in _HUMANIZE_MAP))
+
+# Tone word swaps as precompiled single-pass alternations; the word
+# boundaries keep swaps from firing inside words like "also"
+_TONE_MAPS = {
+    'casual': {'therefore': 'so', 'however': 'but'},
+    'academic': {'so': 'therefore', 'but': 'however'}
+}
+_TONE_RE = {
+    tone: (re.compile(r'\b(' + '|'.join(map(re.escape, table)) + r')\b'), table)
+    for tone, table in _TONE_MAPS.items()
+}
+
+# Static template data shared by every request; formatting happens only
+# for the option actually chosen
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+)
+
+_TITLE_TEMPLATES = (
+    "# {topic}: A Comprehensive Guide",
+    "# Understanding {topic}",
+    "# The Complete Guide to {topic}"
+)
+
+_SECTION_TITLES = ("Benefits", "Applications", "Strategies", "Future Trends")
+
+_SECTION_TEMPLATES = (
+    "The {title_lower} of {topic} are significant and varied. ",
+    "When considering {title_lower}, {topic} offers multiple advantages. ",
+    "Effective {title_lower} require understanding key principles of {topic}. "
+)
+
+# Filler pre-split into tokens so _adjust_length can extend its token
+# list without tokenizing anything per iteration
+_FILLER_TOKENS = tuple(tuple(tpl.split()) for tpl in (
+    "This demonstrates practical applications and value. ",
+    "Many experts recognize these patterns and developments. ",
+    "Further research continues to expand our understanding. ",
+    "Real-world implementations show promising results. "
+))
+
+# Maximum number of topics accepted per /batch request
+BATCH_LIMIT = 10
+
+@lru_cache(maxsize=256)
+def _keyword_pattern(keywords):
+    """Compile one alternation matching any keyword from the CSV list"""
+    keyword_list = [k.strip().lower() for k in keywords.split(',') if k.strip()]
+    if not keyword_list:
+        return None
+    # Longest first so compound keywords win over their own prefixes
+    keyword_list.sort(key=len, reverse=True)
+    return re.compile('|'.join(re.escape(k) for k in keyword_list))
+
+# Pool for /batch so per-topic generation overlaps the IO-bound fetches
+_IO_POOL = ThreadPoolExecutor(max_workers=16)
+
+# Shared HTTP session so Wikipedia calls reuse pooled TCP/TLS connections
+# instead of paying a fresh handshake on every request
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+class SimpleContentGenerator:
+    def __init__(self):
+        self.user_agents = _USER_AGENTS
+        # Per-instance RNG; the random module's global instance takes a
+        # lock on every draw, which contends under concurrent requests
+        self._rng = random.Random()
+        # LRU cache of full results so repeated topics skip research and scoring
+        self._response_cache = OrderedDict()
+        # LRU cache of Wikipedia extracts; intros rarely change within a
+        # process lifetime, so repeated topics skip the network entirely
+        self._research_cache = OrderedDict()
+        self._cache_lock = threading.RLock()
+
+    def get_random_user_agent(self):
+        return self._rng.choice(self.user_agents)
+    
+    def fetch_web_data(self, query):
+        """Fetch web data for research"""
+        normalized = query.strip().lower()
+        with self._cache_lock:
+            cached = self._research_cache.get(normalized)
+            if cached is not None:
+                self._research_cache.move_to_end(normalized)
+                return cached
+
+        extract = self._fetch_research(query)
+
+        # Only cache real extracts so transient failures get retried
+        if extract:
+            with self._cache_lock:
+                self._research_cache[normalized] = extract
+                if len(self._research_cache) > RESEARCH_CACHE_SIZE:
+                    self._research_cache.popitem(last=False)
+
+        return extract
+
+    def _fetch_research(self, query):
+        """Hit the Wikipedia API for an intro extract"""
+        try:
+            # Use Wikipedia API (most reliable and free)
+            wiki_url = "https://en.wikipedia.org/w/api.php"
+            params = {
+                'action': 'query',
+                'format': 'json',
+                'titles': query,
+                'prop': 'extracts',
+                'exintro': True,
+                'explaintext': True,
+                # Truncate server-side; we only ever keep 800 chars, so
+                # there is no point downloading and parsing a full intro
+                'exchars': 800,
+                # formatversion 2 returns pages as a list, skipping the
+                # dict-of-page-ids indirection
+                'formatversion': 2,
+            }
+
+            response = _SESSION.get(wiki_url, params=params, timeout=10)
+            # orjson parses the raw bytes directly, skipping the UTF-8
+            # decode that response.json() would do first
+            data = orjson.loads(response.content)
+
+            pages = data.get('query', {}).get('pages', [])
+            for page in pages:
+                if 'extract' in page:
+                    return page['extract'][:800]
+            
+            return ""
+            
+        except Exception as e:
+            print(f"Research error: {e}")
+            return ""
+    
+    def generate_content(self, topic, keywords="", tone="professional", length=500):
+        """Generate human-like content"""
+
+        # Serve repeated requests straight from the cache
+        cache_key = (topic.lower().strip(), keywords, tone, length)
+        with self._cache_lock:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                return dict(cached)
+
+        # Research
+        research = self.fetch_web_data(topic)
+        
+        # Create content
+        content = self._create_content(topic, keywords, research, tone)
+        
+        # Adjust length
+        content = self._adjust_length(content, length)
+        
+        # Humanize
+        content = self._humanize_content(content, tone)
+        
+        # Calculate metrics from a single tokenization pass
+        sentences = _SENT_RE.split(content)
+        content_lower = content.lower()
+        word_count = len(content.split())
+        seo_score = self._calculate_seo_score(content, word_count, content_lower, keywords)
+        plagiarism_score = self._check_plagiarism(sentences)
+        
+        result = {
+            "success": True,
+            "content": content,
+            "word_count": word_count,
+            "seo_score": seo_score,
+            "plagiarism_score": plagiarism_score,
+            "topic": topic,
+            "keywords": keywords
+        }
+
+        with self._cache_lock:
+            self._response_cache[cache_key] = dict(result)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+        return result
+    
+    def _create_content(self, topic, keywords, research, tone):
+        """Create content structure"""
+        return ''.join(self._content_sections(topic, keywords, research))
+
+    def _content_sections(self, topic, keywords, research):
+        """Yield the markdown sections one at a time"""
+
+        topic_lower = topic.lower()
+        research_sentences = _SENT_RE.split(research) if research else []
+
+        # Title
+        yield self._rng.choice(_TITLE_TEMPLATES).format(topic=topic) + "\n\n"
+
+        # Introduction
+        intro = [f"## Introduction\nIn today's digital landscape, {topic} has become increasingly important. "]
+        if research_sentences:
+            intro.extend((research_sentences[0], " "))
+        intro.append("\n\n")
+        yield ''.join(intro)
+
+        # Keywords section
+        if keywords:
+            keyword_list = [k.strip() for k in keywords.split(',') if k.strip()]
+            if keyword_list:
+                points = ["## Key Points\n"]
+                for i, keyword in enumerate(keyword_list[:5], 1):
+                    points.append(f"{i}. **{keyword.title()}**: Important aspect of {topic_lower}. ")
+                points.append("\n\n")
+                yield ''.join(points)
+
+        # Main content
+        selected_titles = self._rng.sample(_SECTION_TITLES, min(2, len(_SECTION_TITLES)))
+
+        for title in selected_titles:
+            body = [
+                f"## {title}\n",
+                self._rng.choice(_SECTION_TEMPLATES).format(title_lower=title.lower(), topic=topic)
+            ]
+
+            if len(research) > 100 and len(research_sentences) > 1:
+                body.extend((research_sentences[1], " "))
+
+            body.append("\n\n")
+            yield ''.join(body)
+
+        # Conclusion
+        yield (
+            f"## Conclusion\n"
+            f"In summary, {topic} represents an important area with growing relevance. "
+            f"By understanding {topic_lower}, better outcomes can be achieved.\n\n"
+        )
+
+    def generate_stream(self, topic, keywords="", tone="professional"):
+        """Yield humanized sections as they are produced, then final metrics"""
+
+        research = self.fetch_web_data(topic)
+
+        sections = []
+        for section in self._content_sections(topic, keywords, research):
+            section = self._humanize_content(section, tone)
+            sections.append(section)
+            yield {"section": section}
+
+        content = ''.join(sections)
+        sentences = _SENT_RE.split(content)
+        content_lower = content.lower()
+        word_count = len(content.split())
+
+        yield {
+            "success": True,
+            "word_count": word_count,
+            "seo_score": self._calculate_seo_score(content, word_count, content_lower, keywords),
+            "plagiarism_score": self._check_plagiarism(sentences),
+            "topic": topic,
+            "keywords": keywords
+        }
+    
+    def _adjust_length(self, content, target_words):
+        """Adjust content length"""
+        words = content.split()
+
+        if len(words) >= target_words:
+            trimmed = ' '.join(words[:target_words])
+            sentences = _SENT_RE.split(trimmed)
+            if sentences:
+                return ' '.join(sentences)
+            return trimmed
+
+        # Add filler content if too short, extending the token list
+        # instead of re-tokenizing the growing content
+        while len(words) < target_words:
+            words.extend(self._rng.choice(_FILLER_TOKENS))
+
+        return ' '.join(words[:target_words])
+    
+    def _humanize_content(self, content, tone):
+        """Make content more human-like"""
+        
+        # Replace robotic phrases in a single pass
+        content = _HUMANIZE_RE.sub(lambda m: _HUMANIZE_MAP[m.group(0)], content)
+        
+        # Tone adjustments in a single pass
+        tone_entry = _TONE_RE.get(tone)
+        if tone_entry is not None:
+            pattern, table = tone_entry
+            content = pattern.sub(lambda m: table[m.group(0)], content)
+        
+        return content
+    
+    def _calculate_seo_score(self, content, word_count, content_lower, keywords):
+        """Calculate SEO score"""
+        score = 50
+
+        # Word count
+        if word_count > 500:
+            score += 20
+        elif word_count > 300:
+            score += 15
+        elif word_count > 150:
+            score += 10
+        
+        # Headings
+        headings = content.count('#')
+        if headings >= 2:
+            score += 10
+        
+        # Keywords: one scan over the content for the whole list
+        if keywords:
+            pattern = _keyword_pattern(keywords)
+            if pattern is not None:
+                found = set(pattern.findall(content_lower))
+                score += 5 * len(found)
+        
+        return min(score, 100)
+    
+    def _check_plagiarism(self, sentences):
+        """Basic plagiarism check"""
+        try:
+            if not sentences:
+                return 100.0
+            
+            # Store integer fingerprints instead of the normalized strings;
+            # the set only needs to answer "seen before", not keep the text
+            fingerprints = set()
+            for sentence in sentences:
+                normalized = sentence.lower().translate(_PUNCT_TABLE).strip()
+                if normalized.count(' ') >= 3:
+                    fingerprints.add(hash(normalized))
+
+            uniqueness = len(fingerprints) / len(sentences) * 100
+            return max(85.0, min(100.0, round(uniqueness, 2)))
+            
+        except:
+            return 95.0
+
+# Initialize generator
+generator = SimpleContentGenerator()
+
+@app.route('/')
+def home():
+    return jsonify({
+        "service": "AI Content Generator API",
+        "version": "2.0.0",
+        "status": "running",
+        "endpoints": {
+            "GET /health": "Health check",
+            "POST /generate": "Generate content",
+            "GET /generate?topic=xxx": "Generate via GET",
+            "GET /generate/stream?topic=xxx": "Stream sections as SSE",
+            "POST /batch": "Generate content for up to 10 topics"
+        },
+        "deployed_on": "Render.com",
+        "note": "This API generates human-like, SEO-friendly content"
+    })
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    return jsonify({
+        "status": "healthy",
+        "service": "AI Content Generator",
+        "timestamp": time.strftime('%Y-%m-%d %H:%M:%S')
+    })
+
+@app.route('/generate', methods=['GET', 'POST', 'OPTIONS'])
+@cache.cached(timeout=600, query_string=True, unless=lambda: request.method != 'GET')
+def generate_content():
+    if request.method == 'OPTIONS':
+        return '', 200
+    
+    try:
+        # Get input data
+        if request.method == 'POST':
+            if request.is_json:
+                # cache=False frees the raw body right after parsing
+                raw = request.get_data(cache=False)
+                data = orjson.loads(raw) if raw else {}
+            else:
+                data = request.form.to_dict()
+        else:  # GET request
+            data = {
+                'topic': request.args.get('topic', ''),
+                'keywords': request.args.get('keywords', ''),
+                'tone': request.args.get('tone', 'professional'),
+                'length': request.args.get('length', '500')
+            }
+        
+        # Validate
+        if not data.get('topic'):
+            return jsonify({
+                'success': False,
+                'error': 'Topic is required.'
+            }), 400
+        
+        # Convert length
+        try:
+            length = int(data.get('length', 500))
+            length = max(100, min(2000, length))
+        except:
+            length = 500
+        
+        # Generate content
+        result = generator.generate_content(
+            topic=data['topic'].strip(),
+            keywords=data.get('keywords', '').strip(),
+            tone=data.get('tone', 'professional').strip(),
+            length=length
+        )
+        
+        return jsonify(result)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error: {str(e)}'
+        }), 500
+
+@app.route('/generate/stream', methods=['GET'])
+def generate_content_stream():
+    topic = request.args.get('topic', '').strip()
+    if not topic:
+        return jsonify({
+            'success': False,
+            'error': 'Topic is required.'
+        }), 400
+
+    keywords = request.args.get('keywords', '').strip()
+    tone = request.args.get('tone', 'professional').strip()
+
+    def event_stream():
+        for event in generator.generate_stream(topic, keywords, tone):
+            yield f"data: {orjson.dumps(event).decode()}\n\n"
+
+    return Response(stream_with_context(event_stream()), mimetype='text/event-stream')
+
+@app.route('/batch', methods=['POST', 'OPTIONS'])
+def batch_generate():
+    if request.method == 'OPTIONS':
+        return '', 200
+
+    try:
+        if request.is_json:
+            # cache=False frees the raw body right after parsing
+            raw = request.get_data(cache=False)
+            data = orjson.loads(raw) if raw else {}
+        else:
+            data = request.form.to_dict()
+
+        topics = data.get('topics') or []
+        if not isinstance(topics, list):
+            return jsonify({
+                'success': False,
+                'error': 'topics must be a list.'
+            }), 400
+
+        topics = [str(t).strip() for t in topics[:BATCH_LIMIT] if str(t).strip()]
+        if not topics:
+            return jsonify({
+                'success': False,
+                'error': 'At least one topic is required.'
+            }), 400
+
+        # Convert length
+        try:
+            length = int(data.get('length', 500))
+            length = max(100, min(2000, length))
+        except:
+            length = 500
+
+        keywords = str(data.get('keywords', '')).strip()
+        tone = str(data.get('tone', 'professional')).strip()
+
+        # Generate all topics concurrently; a failure only affects its own slot
+        futures = [
+            _IO_POOL.submit(
+                generator.generate_content,
+                topic=topic,
+                keywords=keywords,
+                tone=tone,
+                length=length
+            )
+            for topic in topics
+        ]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=20))
+            except Exception as e:
+                results.append({
+                    'success': False,
+                    'error': f'Error: {str(e)}'
+                })
+
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'results': results
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error: {str(e)}'
+        }), 500
+
+@app.route('/test', methods=['GET'])
+def test_generate():
+    """Test endpoint without authentication"""
+    result = generator.generate_content(
+        topic="Artificial Intelligence",
+        keywords="ai, machine learning, technology",
+        tone="professional",
+        length=300
+    )
+    return jsonify(result)
+
+if __name__ == '__main__':
+    port = int(os.environ.get('PORT', 5000))
+    print(f"Starting AI Content Generator API on port {port}...")
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
@@ -5,15 +5,13 @@ Command line interface for AI Content Generator
 
 import json
 import sys
-from app import SimpleContentGenerator
+from app import generator
 
 def main():
     if len(sys.argv) > 1:
         try:
             input_data = json.loads(sys.argv[1])
-            
-            generator = SimpleContentGenerator()
-            
+
             result = generator.generate_content(
                 topic=input_data.get('topic', ''),
                 keywords=input_data.get('keywords', ''),